@@ -1,3 +0,0 @@
-def classFactory(iface):
-    from .overlap_resolver import OverlapResolver
-    return OverlapResolver(iface) 
\ No newline at end of file
@@ -1,43 +1,34 @@
 import os
-import shutil
 import zipfile
 
 def create_plugin_package():
-    # Create plugin directory
+    # Name of the plugin directory inside the archive
     plugin_dir = "overlap_resolver"
-    if os.path.exists(plugin_dir):
-        shutil.rmtree(plugin_dir)
-    os.makedirs(plugin_dir)
 
-    # List of files to include
+    # List of files to include. The plugin is shipped from the package
+    # directory as one unit, so the resolver, logger and dialog always match
     files_to_copy = [
-        "metadata.txt",
-        "__init__.py",
-        "overlap_resolver.py",
-        "overlap_resolver_dialog.py",
-        "overlap_resolver_dialog.ui",
-        "README.md",
-        "requirements.txt"
+        "overlap_resolver/metadata.txt",
+        "overlap_resolver/__init__.py",
+        "overlap_resolver/overlap_resolver.py",
+        "overlap_resolver/logger.py",
+        "overlap_resolver/overlap_resolver_dialog.py",
+        "overlap_resolver/overlap_resolver_dialog.ui",
+        "overlap_resolver/README.md",
+        "overlap_resolver/requirements.txt"
     ]
 
-    # Copy files to plugin directory
-    for file in files_to_copy:
-        if os.path.exists(file):
-            shutil.copy2(file, os.path.join(plugin_dir, file))
-
-    # Create ZIP file
+    # Write files straight into the ZIP file under the plugin directory.
+    # The archive is small text files, so the fastest deflate level is enough
     zip_filename = "overlap_resolver.zip"
-    with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(plugin_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, os.path.dirname(plugin_dir))
-                zipf.write(file_path, arcname)
+    with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+        for file in files_to_copy:
+            if os.path.exists(file):
+                zipf.write(file, arcname=os.path.join(plugin_dir, os.path.basename(file)))
 
     print(f"Plugin package created: {zip_filename}")
-    print(f"Plugin directory created: {plugin_dir}")
     print("\nTo install the plugin:")
-    print("1. Copy the 'overlap_resolver' folder to your QGIS plugins directory:")
+    print("1. Extract the 'overlap_resolver' folder from the ZIP file into your QGIS plugins directory:")
     print("   - Windows: C:\\Users\\<username>\\AppData\\Roaming\\QGIS\\QGIS3\\profiles\\default\\python\\plugins\\")
     print("   - Linux: ~/.local/share/QGIS/QGIS3/profiles/default/python/plugins/")
     print("   - macOS: ~/Library/Application Support/QGIS/QGIS3/profiles/default/python/plugins/")
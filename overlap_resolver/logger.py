@@ -1,14 +1,17 @@
+import atexit
 import logging
+import logging.handlers
 import os
 from datetime import datetime
 from qgis.core import QgsMessageLog, Qgis
 from qgis.PyQt.QtWidgets import QMessageBox
 
 class PluginLogger:
-    def __init__(self, plugin_name):
+    def __init__(self, plugin_name, level=logging.INFO):
         self.plugin_name = plugin_name
         self.logger = logging.getLogger(plugin_name)
-        self.logger.setLevel(logging.DEBUG)
+        # Debug messages are skipped unless a lower level is requested
+        self.logger.setLevel(level)
         
         # Create logs directory in user's home directory
         self.log_dir = os.path.join(os.path.expanduser('~'), 'qgis_plugin_logs')
@@ -19,54 +22,85 @@ class PluginLogger:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         self.log_file = os.path.join(self.log_dir, f'{plugin_name}_{timestamp}.log')
         
-        # File handler
-        file_handler = logging.FileHandler(self.log_file)
+        # File handler (the file is only opened on the first write)
+        file_handler = logging.FileHandler(self.log_file, delay=True)
         file_handler.setLevel(logging.DEBUG)
         
         # Create formatter
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(formatter)
         
-        # Add handler to logger
-        self.logger.addHandler(file_handler)
+        # Buffer records in memory and write them out in batches; errors,
+        # a full buffer and interpreter exit all force a flush
+        self.memory_handler = logging.handlers.MemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=file_handler)
+        atexit.register(self.memory_handler.flush)
         
-        # Log initial message
-        self.logger.info(f"Plugin {plugin_name} started")
+        # Add handler to logger
+        self.logger.addHandler(self.memory_handler)
         
-    def debug(self, message):
+    def debug(self, message, *args):
         """Log debug message"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        if args:
+            message = message % args
         self.logger.debug(message)
         QgsMessageLog.logMessage(message, self.plugin_name, Qgis.Info)
         
-    def info(self, message):
+    def info(self, message, *args):
         """Log info message"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        if args:
+            message = message % args
         self.logger.info(message)
         QgsMessageLog.logMessage(message, self.plugin_name, Qgis.Info)
         
-    def warning(self, message):
+    def warning(self, message, *args):
         """Log warning message"""
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        if args:
+            message = message % args
         self.logger.warning(message)
         QgsMessageLog.logMessage(message, self.plugin_name, Qgis.Warning)
         
-    def error(self, message, show_dialog=False):
+    def error(self, message, *args, show_dialog=False):
         """Log error message"""
-        self.logger.error(message)
-        QgsMessageLog.logMessage(message, self.plugin_name, Qgis.Critical)
+        if args:
+            message = message % args
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(message)
+            QgsMessageLog.logMessage(message, self.plugin_name, Qgis.Critical)
         if show_dialog:
             QMessageBox.critical(None, "Error", message)
             
-    def critical(self, message, show_dialog=True):
+    def critical(self, message, *args, show_dialog=True):
         """Log critical message"""
-        self.logger.critical(message)
-        QgsMessageLog.logMessage(message, self.plugin_name, Qgis.Critical)
+        if args:
+            message = message % args
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self.logger.critical(message)
+            QgsMessageLog.logMessage(message, self.plugin_name, Qgis.Critical)
         if show_dialog:
             QMessageBox.critical(None, "Critical Error", message)
             
+    def set_level(self, level):
+        """Change the minimum level of messages that are logged"""
+        self.logger.setLevel(level)
+        
+    def flush(self):
+        """Write any buffered records to the log file"""
+        self.memory_handler.flush()
+        
     def get_log_file_path(self):
         """Get the path to the current log file"""
+        self.flush()
         return self.log_file
         
     def show_log_location(self):
         """Show a message box with the log file location"""
+        self.flush()
         QMessageBox.information(None, "Log File Location", 
                               f"Log file is located at:\n{self.log_file}") 
\ No newline at end of file
@@ -1,7 +1,9 @@
+from qgis.PyQt.QtCore import QVariant
 from qgis.PyQt.QtWidgets import QAction, QFileDialog, QMessageBox, QProgressDialog
 from qgis.core import (QgsProject, QgsVectorLayer, QgsFeature, QgsGeometry,
                       QgsWkbTypes, QgsCoordinateReferenceSystem, QgsField, QgsFields,
-                      QgsVectorFileWriter, QgsMessageLog, QgsSpatialIndex)
+                      QgsVectorFileWriter, QgsMessageLog, QgsSpatialIndex,
+                      QgsFeatureRequest, QgsRectangle, Qgis)
 from qgis.utils import iface
 from datetime import datetime
 import processing
@@ -9,16 +11,162 @@ import re
 import os
 from .overlap_resolver_dialog import OverlapResolverDialog
 from .logger import PluginLogger
-from multiprocessing import Pool, cpu_count
-from functools import partial
+from functools import partial, lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import namedtuple
 import math
 
+
+# Field name keywords that suggest a date/time column
+_DT_KEY_RE = re.compile(r'date|time|dt|survey|gps|epoch', re.IGNORECASE)
+
+# Above this many input features, overlap detection keeps only bounding boxes
+# in memory and fetches geometries on demand through a bounded cache
+_GEOMETRY_CACHE_LIMIT = 100_000
+
+# Layers with more fields than this skip the try-every-field fallback
+_MAX_FALLBACK_FIELDS = 20
+
+# QGIS shares one GEOS context between threads before 3.34, which GEOS does
+# not allow, so geometry work only runs on worker threads from 3.34 on
+_THREADED_GEOS = Qgis.QGIS_VERSION_INT >= 33400
+
+# Reference to an overlapping feature, resolved lazily through its layer id
+OverlapRelation = namedtuple('OverlapRelation', 'layer_id feature_id intersection_area')
+
+# One detected overlap between two features, stored as a compact record
+OverlapResult = namedtuple('OverlapResult', 'feature1_id feature2_id intersection intersection_area')
+
+# Regex skeletons for strptime directives, loose enough to never reject a
+# value that strptime itself would accept
+_DIRECTIVE_PATTERNS = {
+    '%Y': r'\d{4}',
+    '%m': r'\d{1,2}',
+    '%d': r'\d{1,2}',
+    '%H': r'\d{1,2}',
+    '%I': r'\d{1,2}',
+    '%M': r'\d{1,2}',
+    '%S': r'\d{1,2}',
+    '%j': r'\d{1,3}',
+    '%b': r'[A-Za-z]+\.?',
+    '%p': r'[AaPp]\.?[Mm]\.?',
+}
+
+# ISO 8601 shaped formats that datetime.fromisoformat can parse directly
+_ISO_FORMATS = frozenset([
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M",
+])
+_ISO_LAYOUT = re.compile(r'\d{4}-\d{2}-\d{2}(?:[ T]\d{2}:\d{2}(?::\d{2})?)?')
+
+# Fixed-width all-digit formats, parsed by slicing instead of strptime. Each
+# entry holds the value length and the slices for datetime(year, month, day, ...)
+_COMPACT_FORMATS = {
+    "%Y%m%d%H%M%S": (14, (slice(0, 4), slice(4, 6), slice(6, 8),
+                          slice(8, 10), slice(10, 12), slice(12, 14))),
+    "%Y%m%d%H%M": (12, (slice(0, 4), slice(4, 6), slice(6, 8),
+                        slice(8, 10), slice(10, 12))),
+    "%Y%m%d": (8, (slice(0, 4), slice(4, 6), slice(6, 8))),
+    "%d%m%Y": (8, (slice(4, 8), slice(2, 4), slice(0, 2))),
+    "%m%d%Y": (8, (slice(4, 8), slice(0, 2), slice(2, 4))),
+}
+
+# Format sentinel for fields whose values are all ISO 8601 shaped; such fields
+# are parsed with datetime.fromisoformat alone, whatever the separator
+_ISO_SENTINEL = "__iso__"
+
+
+def _format_skeleton(datetime_format):
+    """Build a regex matching the digit/punctuation skeleton of a strptime format"""
+    parts = []
+    for token in re.split(r'(%.)', datetime_format):
+        if token in _DIRECTIVE_PATTERNS:
+            parts.append(_DIRECTIVE_PATTERNS[token])
+        elif token:
+            # strptime treats whitespace in the format as one or more spaces
+            parts.append(r'\s+'.join(re.escape(chunk) for chunk in token.split(' ')))
+    return ''.join(parts)
+
+
+def _is_iso_value(datetime_str, datetime_format):
+    """Check that a value is laid out exactly like the given ISO format"""
+    # Zero-padded values are two characters longer than the format (%Y -> 4 digits)
+    if len(datetime_str) != len(datetime_format) + 2 or not _ISO_LAYOUT.fullmatch(datetime_str):
+        return False
+    return len(datetime_str) == 10 or datetime_str[10] == datetime_format[8]
+
+
+def _matches_format(datetime_str, datetime_format):
+    """Check whether a cleaned value parses with the given format"""
+    try:
+        _parse_dt_cached(datetime_str, datetime_format)
+        return True
+    except ValueError:
+        return False
+
+
+# Maps UTC/Z suffixes to ' UTC' in a single translate pass
+_Z_TRANS = str.maketrans({'Z': ' UTC', 'z': ' UTC'})
+
+
+def _clean_datetime_value(value):
+    """Normalise a raw datetime string before detection or parsing"""
+    # Clean the value (remove extra spaces, handle common variations)
+    value = value.strip()
+    # Handle UTC/Z suffixes
+    return value.translate(_Z_TRANS)
+
+
+def _spread_bits(value):
+    """Spread the low 16 bits of an integer onto the even bit positions"""
+    value = (value | (value << 8)) & 0x00FF00FF
+    value = (value | (value << 4)) & 0x0F0F0F0F
+    value = (value | (value << 2)) & 0x33333333
+    return (value | (value << 1)) & 0x55555555
+
+
+def _morton_key(extent, geom):
+    """Z-order key of a geometry's bounding box centre within an extent"""
+    centre = geom.boundingBox().center()
+    width = extent.width() or 1.0
+    height = extent.height() or 1.0
+    x = min(max(int((centre.x() - extent.xMinimum()) / width * 0xFFFF), 0), 0xFFFF)
+    y = min(max(int((centre.y() - extent.yMinimum()) / height * 0xFFFF), 0), 0xFFFF)
+    return _spread_bits(x) | (_spread_bits(y) << 1)
+
+
+@lru_cache(maxsize=1 << 16)
+def _parse_dt_cached(datetime_str, datetime_format):
+    """Parse a cleaned datetime string, raising ValueError on mismatch"""
+    if datetime_format == _ISO_SENTINEL:
+        # Reject offsets so every parsed value stays naive and comparable
+        if not _ISO_LAYOUT.fullmatch(datetime_str):
+            raise ValueError(f"'{datetime_str}' is not an ISO 8601 datetime")
+        return datetime.fromisoformat(datetime_str)
+    if datetime_format in _ISO_FORMATS and _is_iso_value(datetime_str, datetime_format):
+        return datetime.fromisoformat(datetime_str)
+    compact = _COMPACT_FORMATS.get(datetime_format)
+    if (compact and len(datetime_str) == compact[0]
+            and datetime_str.isascii() and datetime_str.isdigit()):
+        # Every field is two digits (four for the year), exactly as strptime splits them
+        return datetime(*(int(datetime_str[part]) for part in compact[1]))
+    return datetime.strptime(datetime_str, datetime_format)
+
+
 class OverlapResolver:
     def __init__(self, iface):
         self.iface = iface
         self.dlg = None
         self.input_layers = []
         self.datetime_fields = {}
+        self._dt_latest = {}
+        self._fetch_geometry = None
+        self._crs_uri = None
+        self._layers_by_id = {}
+        self._source_layer_ids = {}
         self.logger = PluginLogger("Overlap Resolver")
         self.progress_dialog = None
         self.datetime_formats = [
@@ -87,6 +235,13 @@ class OverlapResolver:
             "%Y-%m-%dT%H:%M:%SZ",    # ISO 8601 with Z for UTC
             "%Y-%m-%dT%H:%MZ"        # ISO 8601 with Z for UTC (no seconds)
         ]
+        self.format_regexes = [(fmt, re.compile(_format_skeleton(fmt), re.IGNORECASE))
+                               for fmt in self.datetime_formats]
+        # Union of every format skeleton, so one match tells whether a value
+        # could be a datetime at all
+        self.format_union = re.compile(
+            '|'.join(f'(?:{pattern.pattern})' for _, pattern in self.format_regexes),
+            re.IGNORECASE)
         
     def initGui(self):
         try:
@@ -137,11 +292,12 @@ class OverlapResolver:
 
         # Check if all layers are polygon layers
         for layer in self.input_layers:
-            if layer.geometryType() != QgsWkbTypes.PolygonGeometry:
-                return False, f"Layer '{layer.name()}' is not a polygon layer"
-            
+            # Layers are opened lazily by the dialog, so check validity first
             if not layer.isValid():
                 return False, f"Layer '{layer.name()}' is not valid"
+            
+            if layer.geometryType() != QgsWkbTypes.PolygonGeometry:
+                return False, f"Layer '{layer.name()}' is not a polygon layer"
 
         # Check if all layers have the same CRS
         first_crs = self.input_layers[0].crs()
@@ -149,6 +305,11 @@ class OverlapResolver:
             if layer.crs() != first_crs:
                 return False, "All layers must have the same coordinate reference system"
 
+        # Every layer shares this CRS, so the memory layer URI is built once
+        self._crs_uri = "Polygon?crs=" + first_crs.authid()
+        self._layers_by_id = {layer.id(): layer for layer in self.input_layers}
+        self._source_layer_ids = {}
+
         return True, ""
 
     def process_layers(self):
@@ -179,6 +340,9 @@ class OverlapResolver:
                     QMessageBox.warning(None, "Warning", "No datetime fields found in any layer!")
                     return
 
+                # Find each layer's most recent datetime once
+                self._compute_latest_datetimes()
+
             # Create a temporary layer for overlaps
             overlap_layer = self.detect_overlaps()
             
@@ -207,28 +371,73 @@ class OverlapResolver:
                                        QMessageBox.Yes | QMessageBox.No)
             
             if reply == QMessageBox.Yes:
-                self.resolve_overlaps()
+                self.resolve_overlaps(resolution_method)
                 
         except Exception as e:
             self.logger.critical(f"Error in process_layers: {str(e)}")
             self.logger.show_log_location()
 
+    def _repair_invalid_geometries(self, layer):
+        """Return repaired geometries for the layer's invalid features, keyed by feature id
+
+        The layer is read and validated once. makeValid can return collections
+        with line or point parts, so only the polygonal parts are kept; a
+        feature with no polygonal part left maps to None.
+        """
+        request = QgsFeatureRequest().setNoAttributes()
+        repaired = {}
+        for feature in layer.getFeatures(request):
+            # Features without a geometry are kept as they are
+            if not feature.hasGeometry():
+                continue
+            geom = feature.geometry()
+            if geom.isGeosValid():
+                continue
+            fixed = geom.makeValid()
+            if QgsWkbTypes.flatType(fixed.wkbType()) == QgsWkbTypes.GeometryCollection:
+                fixed.convertGeometryCollectionToSubclass(QgsWkbTypes.PolygonGeometry)
+            if fixed.type() != QgsWkbTypes.PolygonGeometry or fixed.isEmpty():
+                fixed = None
+            repaired[feature.id()] = fixed
+        return repaired
+
     def fix_invalid_geometries(self):
         """Fix invalid geometries in input layers"""
         try:
             for i, layer in enumerate(self.input_layers):
-                # Check if layer has invalid geometries
-                params = {
-                    'INPUT': layer,
-                    'METHOD': 0,  # 0 = fix geometries
-                    'OUTPUT': 'memory:'
-                }
-                result = processing.run("native:fixgeometries", params)
-                fixed_layer = result['OUTPUT']
+                repaired = self._repair_invalid_geometries(layer)
+                if not repaired:
+                    self.logger.debug("All geometries valid in layer '%s', skipping fix", layer.name())
+                    continue
+
+                # Copy the layer into memory with the repaired geometries so the
+                # source data is never edited. The copy is multi-part because a
+                # repaired polygon can come back as several parts
+                fixed_layer = QgsVectorLayer(
+                    "MultiPolygon?crs=" + layer.crs().authid(), layer.name(), "memory")
+                provider = fixed_layer.dataProvider()
+                provider.addAttributes(layer.fields().toList())
+                fixed_layer.updateFields()
+                features = []
+                for feature in layer.getFeatures():
+                    if feature.id() in repaired:
+                        geom = repaired[feature.id()]
+                        # Features left with no polygonal area are dropped
+                        if geom is None:
+                            continue
+                    else:
+                        geom = feature.geometry()
+                    geom.convertToMultiType()
+                    feature.setGeometry(geom)
+                    features.append(feature)
                 
-                if fixed_layer.isValid():
+                if fixed_layer.isValid() and provider.addFeatures(features)[0]:
                     self.input_layers[i] = fixed_layer
-                    self.logger.info(f"Fixed geometries in layer: {layer.name()}")
+                    del self._layers_by_id[layer.id()]
+                    self._layers_by_id[fixed_layer.id()] = fixed_layer
+                    # The dialog knows the layer by its original id
+                    self._source_layer_ids[fixed_layer.id()] = layer.id()
+                    self.logger.info(f"Fixed {len(repaired)} geometries in layer: {layer.name()}")
                 else:
                     self.logger.warning(f"Failed to fix geometries in layer: {layer.name()}")
         except Exception as e:
@@ -241,66 +450,144 @@ class OverlapResolver:
         for layer in self.input_layers:
             try:
                 layer_fields = {}
-                self.logger.debug(f"Scanning layer '{layer.name()}' for datetime fields")
+                self.logger.debug("Scanning layer '%s' for datetime fields", layer.name())
+
+                # Sample every field from a single attribute-only read
+                samples = self.collect_datetime_samples(layer)
                 
                 for field in layer.fields():
                     field_name = field.name()
                     # Check if field name contains date/time related keywords
-                    if any(keyword in field_name.lower() for keyword in ['date', 'time', 'dt', 'datetime', 'survey', 'gps', 'epoch']):
+                    if _DT_KEY_RE.search(field_name):
                         # Try to detect format from sample values
-                        format = self.detect_datetime_format(layer, field_name)
+                        format = self.detect_datetime_format(samples[field_name], field_name)
                         if format:
                             layer_fields[field_name] = format
-                            self.logger.debug(f"Found datetime field '{field_name}' with format '{format}'")
+                            self.logger.debug("Found datetime field '%s' with format '%s'", field_name, format)
                 
                 if layer_fields:
                     self.datetime_fields[layer.id()] = layer_fields
                     self.logger.info(f"Found {len(layer_fields)} datetime fields in layer '{layer.name()}'")
-                else:
-                    # If no datetime fields found by name, try all fields
+                elif len(layer.fields()) < _MAX_FALLBACK_FIELDS:
+                    # If no datetime fields found by name, try the remaining fields;
+                    # wide layers are skipped rather than probing every column
                     for field in layer.fields():
-                        format = self.detect_datetime_format(layer, field.name())
+                        if _DT_KEY_RE.search(field.name()):
+                            continue
+                        format = self.detect_datetime_format(samples[field.name()], field.name())
                         if format:
                             layer_fields[field.name()] = format
-                            self.logger.debug(f"Found datetime field '{field.name()}' with format '{format}'")
+                            self.logger.debug("Found datetime field '%s' with format '%s'", field.name(), format)
                     if layer_fields:
                         self.datetime_fields[layer.id()] = layer_fields
                         self.logger.info(f"Found {len(layer_fields)} datetime fields in layer '{layer.name()}'")
             except Exception as e:
                 self.logger.error(f"Error detecting datetime fields in layer {layer.name()}: {str(e)}")
 
-    def detect_datetime_format(self, layer, field_name):
-        """Detect datetime format from field values"""
-        try:
-            # Get sample of values (up to 10 features)
-            sample_values = []
-            for feature in layer.getFeatures():
-                value = feature[field_name]
-                if value and isinstance(value, str):
-                    # Clean the value (remove extra spaces, handle common variations)
-                    value = value.strip()
-                    # Handle UTC/Z suffixes
-                    value = value.replace('Z', ' UTC').replace('z', ' UTC')
-                    sample_values.append(value)
-                if len(sample_values) >= 10:
-                    break
+    def _compute_latest_datetimes(self):
+        """Record the most recent datetime of every layer, which orders the layers"""
+        self._dt_latest = {}
+        for layer in self.input_layers:
+            layer_fields = self.datetime_fields.get(layer.id(), {})
+            if not layer_fields:
+                continue
+            datetime_field = next(iter(layer_fields))
+            datetime_format = layer_fields[datetime_field]
+            field_index = layer.fields().indexOf(datetime_field)
+            # setFlags replaces all flags, so it must come before the attribute subset
+            request = (QgsFeatureRequest()
+                       .setFlags(QgsFeatureRequest.NoGeometry)
+                       .setSubsetOfAttributes([field_index]))
+            # Values are cleaned once here so parsing needs no preprocessing,
+            # and each distinct string is only parsed once per layer
+            latest = datetime.min
+            parsed = {}
+            for feature in layer.getFeatures(request):
+                value = feature[field_index]
+                if isinstance(value, str):
+                    if value not in parsed:
+                        parsed[value] = self.parse_datetime(_clean_datetime_value(value), datetime_format)
+                    parsed_value = parsed[value]
+                else:
+                    parsed_value = self.parse_datetime(value, datetime_format)
+                if parsed_value > latest:
+                    latest = parsed_value
+            self._dt_latest[layer.id()] = latest
+
+    def collect_datetime_samples(self, layer):
+        """Collect up to 10 cleaned, non-empty string samples for every field of a layer
 
+        Reading stops as soon as every text field has its 10 samples, so leading
+        NULL rows do not cut a field's sample short.
+        """
+        fields = layer.fields()
+        samples = {field.name(): [] for field in fields}
+        # Only text fields can yield string samples, so only those are read
+        text_fields = [(index, samples[field.name()]) for index, field in enumerate(fields)
+                       if field.type() == QVariant.String]
+        if not text_fields:
+            return samples
+        request = (QgsFeatureRequest()
+                   .setFlags(QgsFeatureRequest.NoGeometry)
+                   .setSubsetOfAttributes([index for index, _ in text_fields]))
+        pending = len(text_fields)
+        for feature in layer.getFeatures(request):
+            attributes = feature.attributes()
+            for index, values in text_fields:
+                if len(values) < 10:
+                    value = attributes[index]
+                    if value and isinstance(value, str):
+                        values.append(_clean_datetime_value(value))
+                        if len(values) == 10:
+                            pending -= 1
+            if not pending:
+                break
+        return samples
+
+    def detect_datetime_format(self, sample_values, field_name):
+        """Detect datetime format from sampled field values"""
+        try:
             if not sample_values:
                 return None
 
-            # Try each format
-            for fmt in self.datetime_formats:
-                valid_count = 0
-                for value in sample_values:
+            # ISO 8601 values are parsed natively, skipping the format table
+            iso_count = 0
+            for value in sample_values:
+                if _ISO_LAYOUT.fullmatch(value):
                     try:
-                        datetime.strptime(value, fmt)
-                        valid_count += 1
+                        datetime.fromisoformat(value)
+                        iso_count += 1
                     except ValueError:
-                        continue
+                        pass
+            if iso_count / len(sample_values) > 0.7:
+                self.logger.debug("Detected ISO 8601 values for field '%s' with %d/%d matches",
+                                  field_name, iso_count, len(sample_values))
+                return _ISO_SENTINEL
+
+            # One union match per sample rules out fields that are not datetimes
+            shaped_values = [value for value in sample_values if self.format_union.fullmatch(value)]
+            if len(shaped_values) / len(sample_values) <= 0.7:
+                return None
+
+            # A format is abandoned as soon as it misses more than 30% of the samples
+            max_failures = 0.3 * len(sample_values)
+
+            # Try each format, only parsing values whose shape matches it
+            for fmt, pattern in self.format_regexes:
+                valid_count = 0
+                failures = len(sample_values) - len(shaped_values)
+                for value in shaped_values:
+                    if pattern.fullmatch(value) and _matches_format(value, fmt):
+                        valid_count += 1
+                    else:
+                        failures += 1
+                        if failures >= max_failures:
+                            break
                 
                 # If more than 70% of samples match this format, use it
                 if valid_count / len(sample_values) > 0.7:
-                    self.logger.debug(f"Detected format '{fmt}' for field '{field_name}' with {valid_count}/{len(sample_values)} matches")
+                    self.logger.debug("Detected format '%s' for field '%s' with %d/%d matches",
+                                      fmt, field_name, valid_count, len(sample_values))
                     return fmt
 
             return None
@@ -318,70 +605,81 @@ class OverlapResolver:
         progress.setAutoReset(True)
         return progress
 
-    def process_feature_batch(self, batch_data):
-        """Process a batch of features in parallel"""
-        layer1_id, feature1_id, feature1_geom_wkt, spatial_indices_data, other_layers_data = batch_data
+    def find_feature_overlaps(self, layer1_id, feature1_id, feature1_geom, candidate_layers, spatial_indices):
+        """Find significant overlaps between one feature and the features of later layers
+
+        Each unordered pair is reported once: candidates come from the feature's
+        own layer (higher feature ids only) and the layers after it.
+        """
         results = []
-        
-        # Convert WKT back to geometry
-        feature1_geom = QgsGeometry.fromWkt(feature1_geom_wkt)
         feature1_bbox = feature1_geom.boundingBox()
+        # Prepared lazily, then reused for every candidate of this feature
+        feature1_engine = None
         
-        # Recreate spatial indices
-        spatial_indices = {}
-        for layer_id, index_data in spatial_indices_data.items():
-            index = QgsSpatialIndex()
-            for bbox in index_data:
-                index.insertFeature(QgsFeature(bbox['id']), bbox['bbox'])
-            spatial_indices[layer_id] = index
-        
-        for layer2_data in other_layers_data:
-            layer2_id = layer2_data['id']
+        # Get potential overlapping features using spatial index
+        for layer2_id, layer2_data in candidate_layers:
+            # Get potential overlaps from spatial index
             potential_overlaps = spatial_indices[layer2_id].intersects(feature1_bbox)
             
             for fid in potential_overlaps:
-                # Skip same feature
-                if f"{layer1_id}_{feature1_id}" == f"{layer2_id}_{fid}":
+                # Skip same feature and pairs already reported from the other side
+                if layer1_id == layer2_id and fid <= feature1_id:
                     continue
                 
-                # Get feature2 geometry from the data
-                feature2_geom = QgsGeometry.fromWkt(layer2_data['features'][fid])
+                feature2_data = layer2_data['features'][fid]
+                feature2_geom = feature2_data.get('geometry')
+                if feature2_geom is None:
+                    feature2_geom = self._fetch_geometry(layer2_id, fid)
                 
-                if feature1_geom.intersects(feature2_geom):
-                    intersection = feature1_geom.intersection(feature2_geom)
-                    
-                    if not intersection.isEmpty():
-                        intersection_area = intersection.area()
-                        feature2_area = feature2_geom.area()
+                # The intersection can be no larger than the overlap of the
+                # bounding boxes, so skip pairs that cannot reach the area
+                # threshold before descending into GEOS
+                if feature1_bbox.intersect(feature2_data['bbox']).area() > 0.0001:
+                    # Detailed check using the prepared geometry
+                    if feature1_engine is None:
+                        feature1_engine = QgsGeometry.createGeometryEngine(feature1_geom.constGet())
+                        feature1_engine.prepareGeometry()
+                    if feature1_engine.intersects(feature2_geom.constGet()):
+                        intersection = QgsGeometry(feature1_engine.intersection(feature2_geom.constGet()))
                         
-                        results.append({
-                            'feature1_id': f"{layer1_id}_{feature1_id}",
-                            'feature2_id': f"{layer2_id}_{fid}",
-                            'layer2_id': layer2_id,
-                            'intersection_wkt': intersection.asWkt(),
-                            'intersection_area': intersection_area,
-                            'feature2_area': feature2_area,
-                            'is_subdivision': intersection_area > 0.95 * feature2_area
-                        })
+                        if not intersection.isEmpty():
+                            intersection_area = intersection.area()
+                            
+                            # Only process if the intersection is significant
+                            if intersection_area > 0.0001:  # Minimum area threshold
+                                # Store each unordered pair canonically, lowest key first
+                                pair = sorted(((layer1_id, feature1_id), (layer2_id, fid)))
+                                results.append(OverlapResult(
+                                    pair[0], pair[1], intersection, intersection_area))
         
         return results
 
+    def find_chunk_overlaps(self, work_items, spatial_indices):
+        """Find the overlaps of a chunk of features on a single worker"""
+        results = []
+        for layer1_id, feature1_id, feature1_geom, candidate_layers in work_items:
+            if feature1_geom is None:
+                feature1_geom = self._fetch_geometry(layer1_id, feature1_id)
+            results.extend(self.find_feature_overlaps(layer1_id, feature1_id, feature1_geom,
+                                                      candidate_layers, spatial_indices))
+        return results
+
     def detect_overlaps(self):
         """Detect overlapping areas between layers, considering survey progression"""
         try:
             # Create a temporary layer for overlaps
-            overlap_layer = QgsVectorLayer("Polygon?crs=" + self.input_layers[0].crs().authid(),
-                                         "Overlaps", "memory")
+            overlap_layer = QgsVectorLayer(self._crs_uri, "Overlaps", "memory")
             
             if not overlap_layer.isValid():
                 raise Exception("Failed to create overlap layer")
 
             # Dictionary to store overlapping features and their relationships
             self.overlapping_features = {}
-            self.feature_areas = {}
 
             # First pass: calculate areas and create spatial indices
             total_features = sum(layer.featureCount() for layer in self.input_layers)
+            # Power-of-two cadence (0.5-1% of the features) so the check is a bit mask
+            update_mask = (1 << (total_features // 200).bit_length()) - 1
             processed_features = 0
             
             progress = self.create_progress_dialog(
@@ -394,40 +692,71 @@ class OverlapResolver:
             spatial_indices = {}
             layer_data = {}
             
+            # Overlap detection only needs geometries
+            geometry_request = QgsFeatureRequest().setNoAttributes()
+            # setFlags replaces all flags, so it must come before setNoAttributes
+            id_request = QgsFeatureRequest().setFlags(QgsFeatureRequest.NoGeometry).setNoAttributes()
+
+            # Large inputs keep only ids and bounding boxes; geometries are
+            # re-read by feature id when a candidate pair needs them
+            keep_geometries = total_features <= _GEOMETRY_CACHE_LIMIT
+
+            @lru_cache(maxsize=10_000)
+            def fetch_geometry(layer_id, fid):
+                request = QgsFeatureRequest(fid).setNoAttributes()
+                return next(self._layers_by_id[layer_id].getFeatures(request)).geometry()
+
+            self._fetch_geometry = fetch_geometry
+
             for layer in self.input_layers:
-                # Create spatial index
-                index = QgsSpatialIndex()
-                layer_data[layer.id()] = {
-                    'id': layer.id(),
-                    'crs': layer.crs().authid(),
+                lid = layer.id()
+                if keep_geometries:
+                    # Bulk load the index from the feature iterator (STR packing)
+                    # and let it store the geometries, which are read back by id.
+                    # The constructor consumes the iterator, so the ids come from
+                    # a second pass that reads neither geometries nor attributes
+                    index = QgsSpatialIndex(layer.getFeatures(geometry_request), None,
+                                            QgsSpatialIndex.FlagStoreFeatureGeometries)
+                    entries = ((feature.id(), index.geometry(feature.id()))
+                               for feature in layer.getFeatures(id_request))
+                else:
+                    # Insert features one by one while reading the layer once
+                    index = QgsSpatialIndex()
+                    entries = ((feature.id(), feature.geometry())
+                               for feature in layer.getFeatures(geometry_request))
+                layer_data[lid] = {
+                    'id': lid,
                     'features': {}
                 }
+                # Extent of the stored geometries, used to prune whole layer pairs
+                layer_extent = QgsRectangle()
+                layer_extent.setMinimal()
                 
-                # Add features to spatial index and store data
-                for feature in layer.getFeatures():
-                    # Add to spatial index
-                    index.insertFeature(feature)
-                    
-                    # Store feature data
-                    feature_id = f"{layer.id()}_{feature.id()}"
+                # Store feature data
+                for fid, geom in entries:
+                    feature_id = (lid, fid)
                     self.overlapping_features[feature_id] = []
-                    self.feature_areas[feature_id] = feature.geometry().area()
                     
                     # Store feature data for processing
-                    layer_data[layer.id()]['features'][feature.id()] = {
-                        'id': feature.id(),
-                        'geometry': feature.geometry(),
-                        'attributes': feature.attributes()
-                    }
+                    bbox = geom.boundingBox()
+                    feature_data = {'id': fid, 'bbox': bbox}
+                    if keep_geometries:
+                        feature_data['geometry'] = geom
+                    else:
+                        index.addFeature(fid, bbox)
+                    layer_data[lid]['features'][fid] = feature_data
+                    layer_extent.combineExtentWith(bbox)
                     
                     processed_features += 1
-                    progress.setValue(processed_features)
-                    
-                    if progress.wasCanceled():
-                        progress.close()
-                        return None
+                    # Only touch the dialog periodically; both calls pump the Qt event loop
+                    if processed_features & update_mask == 0 or processed_features == total_features:
+                        progress.setValue(processed_features)
+                        if progress.wasCanceled():
+                            progress.close()
+                            return None
                 
-                spatial_indices[layer.id()] = index
+                spatial_indices[lid] = index
+                layer_data[lid]['extent'] = layer_extent
 
             # Second pass: detect overlaps using spatial indices
             processed_features = 0
@@ -439,117 +768,104 @@ class OverlapResolver:
                 total_features
             )
 
-            # Process each layer
-            for layer1_id, layer1_data in layer_data.items():
-                index1 = spatial_indices[layer1_id]
-                
-                # Process each feature in the layer
-                for feature1_id, feature1_data in layer1_data['features'].items():
-                    feature1_geom = feature1_data['geometry']
-                    feature1_bbox = feature1_geom.boundingBox()
-                    
-                    # Get potential overlapping features using spatial index
-                    for layer2_id, layer2_data in layer_data.items():
-                        index2 = spatial_indices[layer2_id]
-                        
-                        # Get potential overlaps from spatial index
-                        potential_overlaps = index2.intersects(feature1_bbox)
+            # Test features in chunks, on worker threads where GEOS allows it;
+            # GEOS releases the GIL.
+            # Only unordered layer pairs are visited (a layer against itself and later layers)
+            layer_items = list(layer_data.items())
+            work_items = []
+            for i, (layer1_id, layer1_data) in enumerate(layer_items):
+                # Layers whose extents are disjoint cannot overlap, so the whole
+                # pair is pruned before any per-feature work is queued
+                candidate_layers = [
+                    (layer2_id, layer2_data) for layer2_id, layer2_data in layer_items[i:]
+                    if layer1_data['extent'].intersects(layer2_data['extent'])
+                ]
+                if not candidate_layers:
+                    processed_features += len(layer1_data['features'])
+                    continue
+                work_items.extend(
+                    (layer1_id, feature1_id, feature1_data.get('geometry'), candidate_layers)
+                    for feature1_id, feature1_data in layer1_data['features'].items()
+                )
+            progress.setValue(processed_features)
+            chunk_size = 64
+            chunks = [work_items[i:i + chunk_size] for i in range(0, len(work_items), chunk_size)]
+            if keep_geometries and _THREADED_GEOS:
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    futures = {
+                        executor.submit(self.find_chunk_overlaps, chunk, spatial_indices): len(chunk)
+                        for chunk in chunks
+                    }
+
+                    for future in as_completed(futures):
+                        processed_features += futures[future]
+                        progress.setValue(processed_features)
                         
-                        for fid in potential_overlaps:
-                            # Skip same feature
-                            if f"{layer1_id}_{feature1_id}" == f"{layer2_id}_{fid}":
-                                continue
-                            
-                            feature2_data = layer2_data['features'][fid]
-                            feature2_geom = feature2_data['geometry']
-                            
-                            # Quick check using bounding boxes
-                            if feature1_bbox.intersects(feature2_geom.boundingBox()):
-                                # Detailed check using actual geometries
-                                if feature1_geom.intersects(feature2_geom):
-                                    intersection = feature1_geom.intersection(feature2_geom)
-                                    
-                                    if not intersection.isEmpty():
-                                        intersection_area = intersection.area()
-                                        feature2_area = feature2_geom.area()
-                                        
-                                        # Only process if the intersection is significant
-                                        if intersection_area > 0.0001:  # Minimum area threshold
-                                            all_results.append({
-                                                'feature1_id': f"{layer1_id}_{feature1_id}",
-                                                'feature2_id': f"{layer2_id}_{fid}",
-                                                'layer2_id': layer2_id,
-                                                'intersection': intersection,
-                                                'intersection_area': intersection_area,
-                                                'feature2_area': feature2_area,
-                                                'is_subdivision': intersection_area > 0.95 * feature2_area
-                                            })
-                    
-                    processed_features += 1
+                        if progress.wasCanceled():
+                            for future in futures:
+                                future.cancel()
+                            progress.close()
+                            return None
+
+                # Merge results serially in submission order
+                for future in futures:
+                    all_results.extend(future.result())
+            else:
+                # Geometries read from the layers on demand are not thread safe,
+                # and neither is GEOS before QGIS 3.34, so this thread does the work
+                for chunk in chunks:
+                    all_results.extend(self.find_chunk_overlaps(chunk, spatial_indices))
+                    processed_features += len(chunk)
                     progress.setValue(processed_features)
                     
                     if progress.wasCanceled():
                         progress.close()
                         return None
 
-            # Process results in batches
-            batch_size = 100
-            for i in range(0, len(all_results), batch_size):
-                batch = all_results[i:i + batch_size]
+            # Record relationships and collect overlap features
+            overlap_features = []
+            for feature1_id, feature2_id, intersection, intersection_area in all_results:
+                # Record the relationship on both sides. Store lightweight references
+                # instead of the features themselves
+                self.overlapping_features[feature1_id].append(OverlapRelation(*feature2_id, intersection_area))
+                self.overlapping_features[feature2_id].append(OverlapRelation(*feature1_id, intersection_area))
                 
-                overlap_layer.startEditing()
-                for result in batch:
-                    feature1_id = result['feature1_id']
-                    feature2_id = result['feature2_id']
-                    
-                    # Find the actual layer and feature objects
-                    layer2 = next(layer for layer in self.input_layers if layer.id() == result['layer2_id'])
-                    
-                    # Handle both numeric and hexadecimal feature IDs
-                    try:
-                        # Try to convert to integer first
-                        feature2_fid = int(feature2_id.split('_')[1])
-                    except ValueError:
-                        # If that fails, use the ID as is
-                        feature2_fid = feature2_id.split('_')[1]
-                    
-                    feature2 = layer2.getFeature(feature2_fid)
-                    
-                    self.overlapping_features[feature1_id].append({
-                        'layer': layer2,
-                        'feature': feature2,
-                        'intersection_area': result['intersection_area'],
-                        'feature_area': result['feature2_area'],
-                        'is_subdivision': result['is_subdivision']
-                    })
-                    
-                    # Add to overlap layer
-                    overlap_feature = QgsFeature()
-                    overlap_feature.setGeometry(result['intersection'])
-                    overlap_layer.addFeature(overlap_feature)
-                
-                overlap_layer.commitChanges()
+                overlap_feature = QgsFeature()
+                overlap_feature.setGeometry(intersection)
+                overlap_features.append(overlap_feature)
+
+            # Add all overlaps in a single provider call, bypassing the edit buffer
+            overlap_layer.dataProvider().addFeatures(overlap_features)
+            overlap_layer.updateExtents()
 
             return overlap_layer
         except Exception as e:
             self.logger.critical(f"Error detecting overlaps: {str(e)}")
             raise
+        finally:
+            # Release the cached geometries and the layers they reference
+            if self._fetch_geometry is not None:
+                self._fetch_geometry.cache_clear()
+                self._fetch_geometry = None
 
-    def resolve_overlaps(self):
+    def resolve_overlaps(self, resolution_method):
         """Resolve overlapping areas based on selected method"""
+        # Set once the output file is opened; cleared when it is complete
+        writer = None
         try:
-            # Create output layer
-            output_layer = QgsVectorLayer("Polygon?crs=" + self.input_layers[0].crs().authid(),
-                                        "Resolved_Overlaps", "memory")
-            
-            if not output_layer.isValid():
-                raise Exception("Failed to create output layer")
+            output_path = self.dlg.get_output_path()
+            if not output_path:
+                raise Exception("No output path specified")
+
+            # Ensure the output directory exists
+            output_dir = os.path.dirname(output_path)
+            if not os.path.exists(output_dir):
+                os.makedirs(output_dir)
+                self.logger.debug("Created output directory: %s", output_dir)
 
-            resolution_method = self.dlg.get_resolution_method()
-            
-            # Process in batches
-            batch_size = 100
             total_features = sum(layer.featureCount() for layer in self.input_layers)
+            # Power-of-two cadence (0.5-1% of the features) so the check is a bit mask
+            update_mask = (1 << (total_features // 200).bit_length()) - 1
             processed_features = 0
             
             progress = self.create_progress_dialog(
@@ -558,18 +874,15 @@ class OverlapResolver:
                 total_features
             )
 
-            # First, create a layer to store all areas that should be removed
-            areas_to_remove = QgsVectorLayer("Polygon?crs=" + self.input_layers[0].crs().authid(),
-                                           "Areas_To_Remove", "memory")
-            
-            if not areas_to_remove.isValid():
-                raise Exception("Failed to create areas to remove layer")
+            # First, collect the geometries of all areas that should be removed.
+            # They are only ever unioned, so they stay in memory as plain geometries
+            areas_to_remove = []
 
             # Process layers based on priority
             if resolution_method == "datetime":
-                self.prepare_areas_to_remove_by_datetime(areas_to_remove, batch_size, total_features, processed_features, progress)
+                self.prepare_areas_to_remove_by_datetime(areas_to_remove, processed_features, progress)
             else:
-                self.prepare_areas_to_remove_by_priority(areas_to_remove, batch_size, total_features, processed_features, progress)
+                self.prepare_areas_to_remove_by_priority(areas_to_remove, processed_features, progress)
             
             if progress.wasCanceled():
                 return
@@ -581,9 +894,49 @@ class OverlapResolver:
                 total_features
             )
 
+            # Dissolve the areas to remove into one geometry so each feature
+            # needs a single difference, and prepare it once for every feature
+            removal_union = QgsGeometry.unaryUnion(areas_to_remove)
+            removal_engine = None
+            if not removal_union.isEmpty():
+                removal_engine = QgsGeometry.createGeometryEngine(removal_union.constGet())
+                removal_engine.prepareGeometry()
+
+            # Only open the output once the user can no longer cancel the
+            # preparation. Stream features straight to it, preferring
+            # GeoPackage unless a shapefile or FlatGeobuf was requested
+            options = QgsVectorFileWriter.SaveVectorOptions()
+            output_ext = os.path.splitext(output_path)[1].lower()
+            if output_ext == '.shp':
+                options.driverName = "ESRI Shapefile"
+            elif output_ext == '.fgb':
+                options.driverName = "FlatGeobuf"
+            else:
+                options.driverName = "GPKG"
+            options.fileEncoding = "UTF-8"
+            options.layerOptions = ["SPATIAL_INDEX=YES"]
+            output_fields = self.input_layers[0].fields()
+            writer = QgsVectorFileWriter.create(
+                output_path,
+                output_fields,
+                QgsWkbTypes.MultiPolygon,
+                self.input_layers[0].crs(),
+                QgsProject.instance().transformContext(),
+                options
+            )
+            if writer.hasError() != QgsVectorFileWriter.NoError:
+                raise Exception(f"Error creating output file: {writer.errorMessage()}")
+
+            # Kept features are buffered and streamed to the file in chunks
+            write_batch_size = 1000
+            kept = []
+
             for layer in self.input_layers:
-                features = list(layer.getFeatures())
-                for feature in features:
+                # Map output fields onto this layer's attributes by name
+                layer_fields = layer.fields()
+                field_map = [layer_fields.indexOf(field.name()) for field in output_fields]
+                # Stream the features; only the write buffer is held in memory
+                for feature in layer.getFeatures():
                     # Get the feature's geometry
                     geom = feature.geometry()
                     
@@ -591,46 +944,40 @@ class OverlapResolver:
                     if not geom.isEmpty():
                         # Create a difference geometry by removing all overlapping areas
                         diff_geom = geom
-                        for area_feature in areas_to_remove.getFeatures():
-                            diff_geom = diff_geom.difference(area_feature.geometry())
+                        if removal_engine is not None and removal_engine.intersects(geom.constGet()):
+                            # Subtract only the part of the union under this feature,
+                            # cut out by the prepared engine, so the whole union is
+                            # not converted again for every feature
+                            local_removal = QgsGeometry(removal_engine.intersection(geom.constGet()))
+                            diff_geom = geom.difference(local_removal)
                         
-                        # Only add the feature if it still has geometry after removing overlaps
+                        # Only keep the feature if it still has geometry after removing overlaps
                         if not diff_geom.isEmpty():
-                            new_feature = QgsFeature()
+                            diff_geom.convertToMultiType()
+                            attributes = feature.attributes()
+                            new_feature = QgsFeature(output_fields)
                             new_feature.setGeometry(diff_geom)
-                            new_feature.setAttributes(feature.attributes())
-                            output_layer.startEditing()
-                            output_layer.addFeature(new_feature)
-                            output_layer.commitChanges()
+                            new_feature.setAttributes(
+                                [attributes[i] if i >= 0 else None for i in field_map])
+                            kept.append(new_feature)
+                            if len(kept) >= write_batch_size:
+                                if not writer.addFeatures(kept):
+                                    raise Exception(f"Error writing output file: {writer.errorMessage()}")
+                                kept = []
                     
                     processed_features += 1
-                    progress.setValue(processed_features)
-                    
-                    if progress.wasCanceled():
-                        return
+                    # Only touch the dialog periodically; both calls pump the Qt event loop
+                    if processed_features & update_mask == 0 or processed_features == total_features:
+                        progress.setValue(processed_features)
+                        if progress.wasCanceled():
+                            return
 
-            # Save output layer
-            output_path = self.dlg.get_output_path()
-            if not output_path:
-                raise Exception("No output path specified")
-
-            # Ensure the output directory exists
-            output_dir = os.path.dirname(output_path)
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-                self.logger.debug(f"Created output directory: {output_dir}")
-
-            # Save the layer
-            save_result = QgsVectorFileWriter.writeAsVectorFormat(
-                output_layer, 
-                output_path,
-                "UTF-8", 
-                output_layer.crs(), 
-                "ESRI Shapefile"
-            )
+            # Write whatever is left in the buffer
+            if kept and not writer.addFeatures(kept):
+                raise Exception(f"Error writing output file: {writer.errorMessage()}")
 
-            if save_result[0] != QgsVectorFileWriter.NoError:
-                raise Exception(f"Error saving output file: {save_result[1]}")
+            # Dropping the writer flushes and closes the output file
+            writer = None
 
             self.logger.info(f"Successfully saved output to: {output_path}")
             QMessageBox.information(None, "Success", "Overlaps resolved and saved successfully!")
@@ -638,126 +985,165 @@ class OverlapResolver:
         except Exception as e:
             self.logger.critical(f"Error resolving overlaps: {str(e)}")
             self.logger.show_log_location()
+        finally:
+            if writer is not None:
+                # Cancelled or failed part-way: close the file and remove it
+                writer = None
+                self._discard_output(output_path)
 
-    def prepare_areas_to_remove_by_datetime(self, areas_to_remove, batch_size, total_features, processed_features, progress):
-        """Prepare areas to remove based on datetime values"""
-        try:
-            # Sort layers by datetime (newest first)
-            sorted_layers = []
-            for layer in self.input_layers:
-                layer_fields = self.datetime_fields.get(layer.id(), {})
-                if layer_fields:
-                    datetime_field = next(iter(layer_fields))
-                    datetime_format = layer_fields[datetime_field]
-                    # Get the most recent datetime in the layer
-                    latest_time = datetime.min
-                    for feature in layer.getFeatures():
-                        current_time = self.parse_datetime(feature[datetime_field], datetime_format)
-                        if current_time > latest_time:
-                            latest_time = current_time
-                    sorted_layers.append((layer, latest_time))
-                else:
-                    # If no datetime field, treat as oldest
-                    sorted_layers.append((layer, datetime.min))
+    def _discard_output(self, output_path):
+        """Remove a partially written output file"""
+        if output_path.lower().endswith('.shp'):
+            # Also removes the shapefile's sidecar files
+            QgsVectorFileWriter.deleteShapeFile(output_path)
+        elif os.path.exists(output_path):
+            os.remove(output_path)
+
+    def clip_to_mask(self, geoms, mask):
+        """Return the non-empty intersections of candidate geometries with a mask
+
+        Callers pass only geometries whose bounding boxes touch the mask. This
+        stands in for a native:intersection processing run, which would need the
+        mask written out as a layer for every priority level and would clip
+        feature by feature on a single thread.
+        """
+        # Prepare the mask once per chunk; every geometry of the chunk is tested against it
+        mask_engine = QgsGeometry.createGeometryEngine(mask.constGet())
+        mask_engine.prepareGeometry()
+        intersections = []
+        for geom in geoms:
+            # Use the prepared mask to skip the overlay where possible
+            if not mask_engine.intersects(geom.constGet()):
+                continue
+            # A geometry wholly inside the mask is its own intersection
+            if mask_engine.contains(geom.constGet()):
+                intersection = geom
+            else:
+                # Clip through the prepared engine so the mask is not converted again
+                intersection = QgsGeometry(mask_engine.intersection(geom.constGet()))
+            if not intersection.isNull() and not intersection.isEmpty():
+                intersections.append(intersection)
+        return intersections
+
+    def collect_areas_to_remove(self, sorted_layers, areas_to_remove, processed_features, progress):
+        """Append the parts of each layer covered by the layers before it
+
+        Layers are given highest priority first; the first layer keeps all of
+        its area. The intersection geometries are appended to areas_to_remove.
+        """
+        # Only geometries are needed, so attributes are never read
+        geometry_request = QgsFeatureRequest().setNoAttributes()
+        
+        # Union of all higher priority geometries seen so far
+        mask = QgsGeometry()
+        previous_geoms = []
+        
+        for layer in sorted_layers:
+            # Read the layer's geometries once; they also grow the next mask
+            layer_geoms = [feature.geometry() for feature in layer.getFeatures(geometry_request)]
+            if not previous_geoms:
+                # The first layer has the highest priority and loses nothing
+                previous_geoms = layer_geoms
+                continue
             
-            sorted_layers.sort(key=lambda x: x[1], reverse=True)
+            # Grow the mask of higher priority areas by the layer just above
+            # this one, so earlier layers are never unioned again
+            mask = QgsGeometry.unaryUnion([mask] + previous_geoms)
             
-            # Process each layer in order of datetime
-            for i, (layer, _) in enumerate(sorted_layers):
-                # Skip the first (newest) layer as it has highest priority
-                if i == 0:
-                    continue
-                
-                # Get all features from higher priority layers
-                higher_priority_geoms = []
-                for higher_layer, _ in sorted_layers[:i]:
-                    for feature in higher_layer.getFeatures():
-                        higher_priority_geoms.append(feature.geometry())
+            # Only features whose bounding boxes touch the mask are candidates;
+            # a layer whose extent misses the mask has none at all
+            mask_bbox = mask.boundingBox()
+            if mask.isEmpty() or not layer.extent().intersects(mask_bbox):
+                candidates = []
+            else:
+                candidates = [geom for geom in layer_geoms
+                              if geom.boundingBox().intersects(mask_bbox)]
+            processed_features += len(layer_geoms) - len(candidates)
+            
+            if candidates:
+                # Walk the candidates in Z-order so each chunk covers a compact
+                # part of the mask and reuses the same region of its index
+                candidates.sort(key=partial(_morton_key, mask_bbox))
                 
-                # For each feature in current layer
-                for feature in layer.getFeatures():
-                    geom = feature.geometry()
-                    
-                    # Find intersections with higher priority features
-                    for higher_geom in higher_priority_geoms:
-                        if geom.intersects(higher_geom):
-                            intersection = geom.intersection(higher_geom)
-                            if not intersection.isEmpty():
-                                # Add intersection to areas to remove
-                                remove_feature = QgsFeature()
-                                remove_feature.setGeometry(intersection)
-                                areas_to_remove.startEditing()
-                                areas_to_remove.addFeature(remove_feature)
-                                areas_to_remove.commitChanges()
-                    
-                    processed_features += 1
-                    progress.setValue(processed_features)
+                # Clip the candidates against the mask on worker threads where
+                # GEOS allows it; GEOS releases the GIL. Each chunk prepares its
+                # own mask engine
+                workers = (os.cpu_count() or 1) if _THREADED_GEOS else 1
+                chunk_size = max(64, math.ceil(len(candidates) / (workers * 4)))
+                chunks = [candidates[j:j + chunk_size]
+                          for j in range(0, len(candidates), chunk_size)]
+                if _THREADED_GEOS:
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        futures = {
+                            executor.submit(self.clip_to_mask, chunk, mask): len(chunk)
+                            for chunk in chunks
+                        }
+                        
+                        for future in as_completed(futures):
+                            processed_features += futures[future]
+                            progress.setValue(processed_features)
+                            
+                            if progress.wasCanceled():
+                                for future in futures:
+                                    future.cancel()
+                                return
                     
-                    if progress.wasCanceled():
-                        return
+                    # Collect the areas in submission order
+                    for future in futures:
+                        areas_to_remove.extend(future.result())
+                else:
+                    for chunk in chunks:
+                        areas_to_remove.extend(self.clip_to_mask(chunk, mask))
+                        processed_features += len(chunk)
+                        progress.setValue(processed_features)
                         
+                        if progress.wasCanceled():
+                            return
+
+            previous_geoms = layer_geoms
+
+    def prepare_areas_to_remove_by_datetime(self, areas_to_remove, processed_features, progress):
+        """Prepare areas to remove based on datetime values
+
+        The intersection geometries are appended to the areas_to_remove list.
+        """
+        try:
+            # Sort layers by their most recent datetime (newest first); layers
+            # without a datetime field are treated as oldest
+            sorted_layers = sorted(self.input_layers,
+                                   key=lambda layer: self._dt_latest.get(layer.id(), datetime.min),
+                                   reverse=True)
+            self.collect_areas_to_remove(sorted_layers, areas_to_remove, processed_features, progress)
         except Exception as e:
             self.logger.error(f"Error in prepare_areas_to_remove_by_datetime: {str(e)}")
             raise
 
-    def prepare_areas_to_remove_by_priority(self, areas_to_remove, batch_size, total_features, processed_features, progress):
-        """Prepare areas to remove based on layer priorities"""
+    def prepare_areas_to_remove_by_priority(self, areas_to_remove, processed_features, progress):
+        """Prepare areas to remove based on layer priorities
+
+        The intersection geometries are appended to the areas_to_remove list.
+        """
         try:
             priorities = self.dlg.get_layer_priorities()
             
-            # Sort layers by priority
-            sorted_layers = sorted(self.input_layers, 
-                                 key=lambda layer: priorities.get(layer.id(), float('inf')))
-            
-            # Process each layer in order of priority
-            for i, layer in enumerate(sorted_layers):
-                # Skip the first (highest priority) layer
-                if i == 0:
-                    continue
-                
-                # Get all features from higher priority layers
-                higher_priority_geoms = []
-                for higher_layer in sorted_layers[:i]:
-                    for feature in higher_layer.getFeatures():
-                        higher_priority_geoms.append(feature.geometry())
-                
-                # For each feature in current layer
-                for feature in layer.getFeatures():
-                    geom = feature.geometry()
-                    
-                    # Find intersections with higher priority features
-                    for higher_geom in higher_priority_geoms:
-                        if geom.intersects(higher_geom):
-                            intersection = geom.intersection(higher_geom)
-                            if not intersection.isEmpty():
-                                # Add intersection to areas to remove
-                                remove_feature = QgsFeature()
-                                remove_feature.setGeometry(intersection)
-                                areas_to_remove.startEditing()
-                                areas_to_remove.addFeature(remove_feature)
-                                areas_to_remove.commitChanges()
-                    
-                    processed_features += 1
-                    progress.setValue(processed_features)
-                    
-                    if progress.wasCanceled():
-                        return
-                        
+            # Sort layers by priority, looking each layer's key up only once;
+            # repaired copies are looked up under the id of the layer they replace
+            keyed_layers = [(priorities.get(self._source_layer_ids.get(layer.id(), layer.id()), float('inf')),
+                             index, layer)
+                            for index, layer in enumerate(self.input_layers)]
+            keyed_layers.sort()
+            sorted_layers = [layer for _, _, layer in keyed_layers]
+            self.collect_areas_to_remove(sorted_layers, areas_to_remove, processed_features, progress)
         except Exception as e:
             self.logger.error(f"Error in prepare_areas_to_remove_by_priority: {str(e)}")
             raise
 
     def parse_datetime(self, datetime_str, datetime_format):
-        """Parse datetime string with error handling"""
+        """Parse an already cleaned datetime string with error handling"""
         try:
             if not datetime_str:
                 return datetime.min
-                
-            # Clean the value (remove extra spaces, handle common variations)
-            datetime_str = datetime_str.strip()
-            # Handle UTC/Z suffixes
-            datetime_str = datetime_str.replace('Z', ' UTC').replace('z', ' UTC')
-            return datetime.strptime(datetime_str, datetime_format)
+            return _parse_dt_cached(datetime_str, datetime_format)
         except Exception as e:
             self.logger.error(f"Error parsing datetime '{datetime_str}': {str(e)}")
             return datetime.min 
\ No newline at end of file
@@ -1,6 +1,7 @@
 from qgis.PyQt import uic
 from qgis.PyQt.QtWidgets import QDialog, QFileDialog, QMessageBox, QRadioButton, QVBoxLayout, QWidget, QLabel, QListWidget
 from qgis.core import QgsProject, QgsVectorLayer
+from collections import Counter
 import os
 
 FORM_CLASS, _ = uic.loadUiType(os.path.join(
@@ -17,7 +18,10 @@ class OverlapResolverDialog(QDialog, FORM_CLASS):
         self.btnBrowseOutput.clicked.connect(self.browse_output)
         
         # Initialize lists
-        self.input_layers = []
+        # Layers are only opened when processing asks for them
+        self.layer_paths = []
+        self.layer_names = []
+        self._layers = []
         self.output_path = None
         
         # Add resolution method selection
@@ -54,42 +58,69 @@ class OverlapResolverDialog(QDialog, FORM_CLASS):
             self.update_priority_list()
             
     def update_priority_list(self):
-        self.listPriority.clear()
-        for layer in self.input_layers:
-            self.listPriority.addItem(layer.name())
+        # Only add and remove the items that changed, keeping the user's order
+        missing = Counter(self.layer_names)
+        stale_rows = []
+        for row in range(self.listPriority.count()):
+            name = self.listPriority.item(row).text()
+            if missing[name] > 0:
+                missing[name] -= 1
+            else:
+                stale_rows.append(row)
+        
+        # Suppress per-item relayouts and signals while applying the changes
+        self.listPriority.setUpdatesEnabled(False)
+        self.listPriority.blockSignals(True)
+        try:
+            for row in reversed(stale_rows):
+                self.listPriority.takeItem(row)
+            for name in self.layer_names:
+                if missing[name] > 0:
+                    missing[name] -= 1
+                    self.listPriority.addItem(name)
+        finally:
+            self.listPriority.blockSignals(False)
+            self.listPriority.setUpdatesEnabled(True)
             
     def add_layer(self):
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Select Shapefile", "", "Shapefiles (*.shp)")
             
         if file_path:
-            layer = QgsVectorLayer(file_path, os.path.basename(file_path), "ogr")
-            if layer.isValid():
-                self.input_layers.append(layer)
-                self.listLayers.addItem(layer.name())
-                if self.resolution_method == "priority":
-                    self.listPriority.addItem(layer.name())
-            else:
-                QMessageBox.warning(self, "Warning", "Invalid layer!")
+            # Only the file name is needed for the lists; opening the layer is
+            # deferred to get_input_layers, where validate_layers reports failures
+            name = os.path.splitext(os.path.basename(file_path))[0]
+            self.layer_paths.append(file_path)
+            self.layer_names.append(name)
+            self._layers.append(None)
+            self.listLayers.addItem(name)
+            if self.resolution_method == "priority":
+                self.listPriority.addItem(name)
                 
     def remove_layer(self):
         current_row = self.listLayers.currentRow()
         if current_row >= 0:
             self.listLayers.takeItem(current_row)
-            self.input_layers.pop(current_row)
+            self.layer_paths.pop(current_row)
+            self.layer_names.pop(current_row)
+            self._layers.pop(current_row)
             if self.resolution_method == "priority":
                 self.listPriority.takeItem(current_row)
             
     def browse_output(self):
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Save Output", "", "Shapefiles (*.shp)")
+            self, "Save Output", "", "GeoPackage (*.gpkg);;FlatGeobuf (*.fgb);;Shapefiles (*.shp)")
             
         if file_path:
             self.output_path = file_path
             self.txtOutputPath.setText(file_path)
             
     def get_input_layers(self):
-        return self.input_layers
+        # Open each layer on first use and reuse it afterwards, so layer ids stay stable
+        for row, (file_path, name) in enumerate(zip(self.layer_paths, self.layer_names)):
+            if self._layers[row] is None:
+                self._layers[row] = QgsVectorLayer(file_path, name, "ogr")
+        return list(self._layers)
         
     def get_output_path(self):
         return self.output_path
@@ -98,11 +129,15 @@ class OverlapResolverDialog(QDialog, FORM_CLASS):
         return self.resolution_method
         
     def get_layer_priorities(self):
+        # Map each name to its layer ids once; layers sharing a name are
+        # matched to the list items in order
+        layer_ids = {}
+        for layer in self.get_input_layers():
+            layer_ids.setdefault(layer.name(), []).append(layer.id())
+        
         priorities = {}
         for i in range(self.listPriority.count()):
-            layer_name = self.listPriority.item(i).text()
-            for layer in self.input_layers:
-                if layer.name() == layer_name:
-                    priorities[layer.id()] = i
-                    break
+            ids = layer_ids.get(self.listPriority.item(i).text())
+            if ids:
+                priorities[ids.pop(0)] = i
         return priorities 
\ No newline at end of file